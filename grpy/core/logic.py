@@ -60,6 +60,8 @@ def len_groups(groups: Groups) -> int:
 def remove_from_groups(groups: Groups, user_keys: AbstractSet[UserKey]) -> Groups:
     """Remove an user from the builded groups."""
     user_key_set = set(user_keys)
+    if all(group.isdisjoint(user_key_set) for group in groups):
+        return groups
     group_list = []
     for group in groups:
         both = group.intersection(user_key_set)
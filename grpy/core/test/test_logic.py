@@ -27,6 +27,8 @@ from ..logic import len_groups, make_code, remove_from_groups, sort_groups
 from ..models import Grouping, Groups, UserKey
 from ..utils import now
 
+FORBIDDEN_CODE_CHARS = frozenset("ILOU")
+
 
 def check_code(prev_code, grouping, unique=False) -> None:
     """Check for a valid code."""
@@ -39,8 +41,7 @@ def check_code(prev_code, grouping, unique=False) -> None:
         assert code == make_code(grouping)
     assert code == code.upper()
     assert 1 <= len(code) <= 6
-    for char in ("I", "L", "O", "U"):
-        assert char not in code
+    assert FORBIDDEN_CODE_CHARS.isdisjoint(code)
 
 
 def test_make_code() -> None:
@@ -94,10 +95,10 @@ def test_remove_from_groups() -> None:
     assert remove_from_groups(groups_2, {user_key_1}) == _groups([[2]])
     assert remove_from_groups(groups_2, {user_key_2}) == _groups([[1]])
 
-    assert remove_from_groups(groups_1, set()) == groups_1
-    assert remove_from_groups(groups_1, {UserKey(int=0)}) == groups_1
-    assert remove_from_groups(groups_2, set()) == groups_2
-    assert remove_from_groups(groups_2, {UserKey(int=0)}) == groups_2
+    assert remove_from_groups(groups_1, set()) is groups_1
+    assert remove_from_groups(groups_1, {UserKey(int=0)}) is groups_1
+    assert remove_from_groups(groups_2, set()) is groups_2
+    assert remove_from_groups(groups_2, {UserKey(int=0)}) is groups_2
 
     assert remove_from_groups(groups_1, {user_key_1, user_key_2}) == ()
     assert remove_from_groups(groups_2, {user_key_1, user_key_2}) == ()
@@ -21,7 +21,7 @@
 
 import dataclasses
 from datetime import datetime, timedelta
-from typing import cast
+from typing import Any, Dict
 
 import pytest
 
@@ -30,6 +30,13 @@ from ..models import (Grouping, GroupingKey, GroupingState, Permissions,
                       ValidationFailed)
 from ..utils import now
 
+_USER_KEY = UserKey(int=0)
+_YET = now()
+_DELTA = timedelta(seconds=1)
+_NOTZDATE = datetime(2019, 5, 27, 13, 54, 17)
+_GROUPING = Grouping(
+    None, "code", "name", _USER_KEY, _YET, _YET + _DELTA, None, "RD", 2, 0, "")
+
 
 def test_keytype_operations() -> None:
     """Test class methods of KeyType."""
@@ -68,129 +75,86 @@ def test_user_validation() -> None:
     User(None, "name").validate()
 
 
-def test_user_validation_failed() -> None:
+@pytest.mark.parametrize("changes,match", [
+    ({'key': "123"}, "Key is not an UserKey"),
+    ({'ident': ""}, "Ident is empty"),
+    ({'ident': "\tident"}, "Ident contains leading/trailing whitespace"),
+    ({'last_login': _NOTZDATE}, "Last login date is not UTC: "),
+])
+def test_user_validation_failed(changes: Dict[str, Any], match: str) -> None:
     """An invalid model raises exception."""
-    with pytest.raises(ValidationFailed, match="Key is not an UserKey"):
-        User("123", "name").validate()  # type: ignore
-    with pytest.raises(ValidationFailed, match="Ident is empty"):
-        User(None, "").validate()
-    with pytest.raises(
-            ValidationFailed, match="Ident contains leading/trailing whitespace"):
-        User(None, "\tident").validate()
-    with pytest.raises(ValidationFailed, match="Last login date is not UTC: "):
-        User(None, "ident", last_login=datetime(2019, 5, 27, 13, 51, 35)).validate()
+    with pytest.raises(ValidationFailed, match=match):
+        dataclasses.replace(User(None, "ident"), **changes).validate()
 
 
 def test_grouping_validation() -> None:
     """A valid model raises no exception."""
-    yet = now()
-    delta = timedelta(seconds=1)
-    Grouping(
-        None, "code", "name", UserKey(int=0),
-        yet, yet + delta, yet + delta + delta, "RD", 2, 0, "").validate()
-    Grouping(
-        GroupingKey(int=0), "code", "name", UserKey(int=0),
-        yet, yet + delta, yet + delta + delta, "RD", 2, 0, "").validate()
-
-
-def test_grouping_validation_failed() -> None:
+    _GROUPING.validate()
+    grouping = dataclasses.replace(_GROUPING, close_date=_YET + _DELTA + _DELTA)
+    grouping.validate()
+    dataclasses.replace(grouping, key=GroupingKey(int=0)).validate()
+
+
+@pytest.mark.parametrize("changes,match", [
+    ({'key': "123"}, "Key is not a GroupingKey: "),
+    ({'host_key': None}, "Host is not an UserKey: "),
+    ({'code': ""}, "Code is empty: "),
+    ({'name': ""}, "Name is empty: "),
+    ({'begin_date': _NOTZDATE, 'final_date': _YET}, "Begin date is not UTC: "),
+    ({'final_date': _NOTZDATE}, "Final date is not UTC: "),
+    ({'final_date': _YET}, "Begin date after final date: "),
+    ({'close_date': _NOTZDATE}, "Close date is not UTC: "),
+    ({'close_date': _YET + _DELTA}, "Final date after close date: "),
+    ({'policy': ""}, "Policy is empty: "),
+    ({'max_group_size': 0}, "Maximum group size < 1: 0"),
+    ({'member_reserve': -1}, "Member reserve < 0: -1"),
+])
+def test_grouping_validation_failed(changes: Dict[str, Any], match: str) -> None:
     """An invalid model raises exception."""
-    yet = now()
-    notzdate = datetime(2019, 5, 27, 13, 54, 17)
-    delta = timedelta(seconds=1)
-    with pytest.raises(ValidationFailed, match="Key is not a GroupingKey: "):
-        Grouping(
-            cast(GroupingKey, "123"), "code", "name", UserKey(int=0), yet,
-            yet + delta, None, "RD", 2, 0, "").validate()
-    with pytest.raises(ValidationFailed, match="Host is not an UserKey: "):
-        Grouping(
-            None, "code", "name", cast(UserKey, None), yet, yet + delta, None,
-            "RD", 2, 0, "").validate()
-    with pytest.raises(ValidationFailed, match="Code is empty: "):
-        Grouping(
-            None, "", "name", UserKey(int=0), yet, yet + delta, None,
-            "RD", 2, 0, "").validate()
-    with pytest.raises(ValidationFailed, match="Name is empty: "):
-        Grouping(
-            None, "code", "", UserKey(int=0), yet, yet + delta, None,
-            "RD", 2, 0, "").validate()
-    with pytest.raises(ValidationFailed, match="Begin date is not UTC: "):
-        Grouping(
-            None, "code", "name", UserKey(int=0), notzdate, yet, None,
-            "RD", 2, 0, "").validate()
-    with pytest.raises(ValidationFailed, match="Final date is not UTC: "):
-        Grouping(
-            None, "code", "name", UserKey(int=0), yet, notzdate, None,
-            "RD", 2, 0, "").validate()
-    with pytest.raises(ValidationFailed, match="Begin date after final date: "):
-        Grouping(
-            None, "code", "name", UserKey(int=0), yet, yet, None,
-            "RD", 2, 0, "").validate()
-    with pytest.raises(ValidationFailed, match="Close date is not UTC: "):
-        Grouping(
-            None, "code", "name", UserKey(int=0), yet, yet + delta, notzdate,
-            "RD", 2, 0, "").validate()
-    with pytest.raises(ValidationFailed, match="Final date after close date: "):
-        Grouping(
-            None, "code", "name", UserKey(int=0), yet, yet + delta, yet + delta,
-            "RD", 2, 0, "").validate()
-    with pytest.raises(ValidationFailed, match="Policy is empty: "):
-        Grouping(
-            None, "code", "name", UserKey(int=0), yet, yet + delta, None,
-            "", 2, 0, "").validate()
-    with pytest.raises(ValidationFailed, match="Maximum group size < 1: 0"):
-        Grouping(
-            None, "code", "name", UserKey(int=0), yet, yet + delta, None,
-            "RD", 0, 0, "").validate()
-    with pytest.raises(ValidationFailed, match="Member reserve < 0: -1"):
-        Grouping(
-            None, "code", "name", UserKey(int=0), yet, yet + delta, None,
-            "RD", 2, -1, "").validate()
+    with pytest.raises(ValidationFailed, match=match):
+        dataclasses.replace(_GROUPING, **changes).validate()
 
 
 def test_get_state() -> None:
     """Return valid date-based states."""
-    yet = now()
     assert GroupingState.NEW == Grouping(
-        None, ".", "name", UserKey(int=0), yet + timedelta(days=3),
-        yet + timedelta(days=7), None, "RD", 7, 7, "").get_state()
+        None, ".", "name", _USER_KEY, _YET + timedelta(days=3),
+        _YET + timedelta(days=7), None, "RD", 7, 7, "").get_state()
     assert GroupingState.AVAILABLE == Grouping(
-        None, ".", "name", UserKey(int=0), yet - timedelta(days=3),
-        yet + timedelta(days=7), None, "RD", 7, 7, "").get_state()
+        None, ".", "name", _USER_KEY, _YET - timedelta(days=3),
+        _YET + timedelta(days=7), None, "RD", 7, 7, "").get_state()
     assert GroupingState.FINAL == Grouping(
-        None, ".", "name", UserKey(int=0), yet - timedelta(days=3),
-        yet - timedelta(days=2), None, "RD", 7, 7, "").get_state()
+        None, ".", "name", _USER_KEY, _YET - timedelta(days=3),
+        _YET - timedelta(days=2), None, "RD", 7, 7, "").get_state()
     assert GroupingState.FINAL == Grouping(
-        None, ".", "name", UserKey(int=0), yet - timedelta(days=3),
-        yet - timedelta(days=2), yet + timedelta(days=7), "RD", 7, 7, "").get_state()
+        None, ".", "name", _USER_KEY, _YET - timedelta(days=3),
+        _YET - timedelta(days=2), _YET + timedelta(days=7), "RD", 7, 7, "").get_state()
     assert GroupingState.CLOSED == Grouping(
-        None, ".", "name", UserKey(int=0), yet - timedelta(days=3),
-        yet - timedelta(days=2), yet - timedelta(days=1), "RD", 7, 7, "").get_state()
+        None, ".", "name", _USER_KEY, _YET - timedelta(days=3),
+        _YET - timedelta(days=2), _YET - timedelta(days=1), "RD", 7, 7, "").get_state()
 
 
 def test_can_register() -> None:
     """User can register for Grouping."""
-    yet = now()
     grouping = Grouping(
-        None, ".", "name", UserKey(int=0), yet - timedelta(days=6),
-        yet + timedelta(days=1), None, "RD", 7, 7, "Note")
+        None, ".", "name", _USER_KEY, _YET - timedelta(days=6),
+        _YET + timedelta(days=1), None, "RD", 7, 7, "Note")
     assert grouping.can_register()
-    assert not dataclasses.replace(grouping, final_date=yet).can_register()
+    assert not dataclasses.replace(grouping, final_date=_YET).can_register()
 
 
 def test_registration_validation() -> None:
     """A valid model raises no exception."""
-    Registration(GroupingKey(int=0), UserKey(int=0), UserPreferences()).validate()
+    Registration(GroupingKey(int=0), _USER_KEY, UserPreferences()).validate()
 
 
-def test_registration_validation_failed() -> None:
+@pytest.mark.parametrize("changes,match", [
+    ({'grouping_key': None}, "Grouping is not a GroupingKey:"),
+    ({'user_key': None}, "Participant is not an UserKey:"),
+    ({'preferences': ""}, "Preferences is not a UserPreferences"),
+])
+def test_registration_validation_failed(changes: Dict[str, Any], match: str) -> None:
     """An invalid model raises exception."""
-    with pytest.raises(ValidationFailed, match="Grouping is not a GroupingKey:"):
-        Registration(
-            cast(GroupingKey, None), UserKey(int=0), UserPreferences()).validate()
-    with pytest.raises(ValidationFailed, match="Participant is not an UserKey:"):
-        Registration(
-            GroupingKey(int=0), cast(UserKey, None), UserPreferences()).validate()
-    with pytest.raises(ValidationFailed, match="Preferences is not a UserPreferences"):
-        Registration(
-            GroupingKey(int=0), UserKey(int=0), cast(UserPreferences, "")).validate()
+    registration = Registration(GroupingKey(int=0), _USER_KEY, UserPreferences())
+    with pytest.raises(ValidationFailed, match=match):
+        dataclasses.replace(registration, **changes).validate()
@@ -22,26 +22,28 @@
 import dataclasses
 from typing import Type, cast
 
+import pytest
+
 from ...policies.preferred import PreferredPreferences
 from ...policies.simple_belbin import SimpleBelbinPreferences
 from ..models import UserPreferences
 from ..preferences import get_code, get_preferences, register_preferences
 
-_PREFERENCES_CLASSES = {
+_PREFERENCES_CLASSES = (
     UserPreferences, PreferredPreferences, SimpleBelbinPreferences,
-}
+)
 
 
-def test_valid_preferences() -> None:
+@pytest.mark.parametrize("pref_class", _PREFERENCES_CLASSES)
+def test_valid_preferences(pref_class: Type[UserPreferences]) -> None:
     """Test registry for known preferences."""
-    for pref_class in _PREFERENCES_CLASSES:
-        # Dirty trick to instantiate a preferences object
-        field_names = [field.name for field in dataclasses.fields(pref_class)]
-        code = get_code(pref_class(*field_names))
+    # Dirty trick to instantiate a preferences object
+    field_names = [field.name for field in dataclasses.fields(pref_class)]
+    code = get_code(pref_class(*field_names))
 
-        assert code is not None
-        preferences_class = get_preferences(code)
-        assert pref_class == preferences_class
+    assert code is not None
+    preferences_class = get_preferences(code)
+    assert pref_class == preferences_class
 
 
 @dataclasses.dataclass(frozen=True)  # pylint: disable=too-few-public-methods
@@ -57,13 +59,13 @@ class UnregisteredPreferences(UserPreferences):
 def test_invalid_preferences() -> None:
     """Registry must return `None` for invalid preferences."""
     for obj in (1, None, NoPreferences, UnregisteredPreferences):
-        assert get_code(cast(UserPreferences, obj)) is None
+        assert get_code(obj) is None  # type: ignore
 
 
 def test_invalid_code() -> None:
     """Registry must return `None` for invalid codes."""
     for code in (None, 1, "", NoPreferences, chr(0) * 4):
-        assert get_preferences(cast(str, code)) is None
+        assert get_preferences(code) is None  # type: ignore
 
 
 @dataclasses.dataclass(frozen=True)  # pylint: disable=too-few-public-methods
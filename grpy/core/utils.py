@@ -21,7 +21,7 @@
 
 import collections
 from datetime import datetime
-from typing import Deque, Iterable, TypeVar
+from typing import Deque, Iterable, TypeVar, cast
 
 from pytz import UTC
 
@@ -32,11 +32,14 @@ def now() -> datetime:
 
 
 T = TypeVar("T")  # pylint: disable=invalid-name
+_SENTINEL = object()
 
 
 class LazyList(Iterable[T]):
     """A list-like structure based on an iterator."""
 
+    __slots__ = ("_iterator", "_front")
+
     def __init__(self, iterator: Iterable[T]):
         """Initialize lazy list with an iterator."""
         self._iterator = iter(iterator)
@@ -44,11 +47,10 @@ class LazyList(Iterable[T]):
 
     def _consume(self) -> bool:
         """Move one element from iterator to front elements."""
-        try:
-            element = next(self._iterator)
-        except StopIteration:
+        element = next(self._iterator, _SENTINEL)
+        if element is _SENTINEL:
             return False
-        self._front.append(element)
+        self._front.append(cast(T, element))
         return True
 
     def __bool__(self):
@@ -59,8 +61,7 @@ class LazyList(Iterable[T]):
 
     def __len__(self) -> int:
         """Return the length of the iterator."""
-        while self._consume():
-            pass
+        self._front.extend(self._iterator)
         return len(self._front)
 
     def __iter__(self):
@@ -19,7 +19,9 @@
 
 """Tests for common grouping policies."""
 
-from typing import Set, cast
+from typing import FrozenSet, Set, cast
+
+import pytest
 
 from ...core.models import Groups, User, UserKey, UserPreferences
 from .. import get_policy, identity_policy, random_policy
@@ -39,41 +41,34 @@ def assert_members_and_sizes(
     assert users == set()
 
 
-def test_identity_policy() -> None:
-    """The no policy places all users into groups by name."""
-    data = {}
-    repository = {}
-    for i in range(20):
-        user = User(UserKey(int=i), "user-%03d" % i)
-        repository[user.key] = user
-        data[user] = UserPreferences()
+USER_DATA = {
+    User(UserKey(int=i), "user-%03d" % i): UserPreferences() for i in range(20)}
+USER_IDENTS = {user.key: user.ident for user in USER_DATA}
+USER_KEYS = cast(FrozenSet[UserKey], frozenset(USER_IDENTS))
+
 
-    for max_group_size in range(1, 10):
-        for member_reserve in range(10):
-            groups = identity_policy(data, max_group_size, member_reserve)
-            users = cast(Set[UserKey], {user.key for user in data})
-            assert_members_and_sizes(groups, users, max_group_size)
-            last_ident = ""
-            for group in groups:
-                idents = [repository[member].ident for member in group]
-                if idents:
-                    assert last_ident < min(idents)
-                    last_ident = max(idents)
-                else:
-                    last_ident = chr(65536)
+@pytest.mark.parametrize("max_group_size", range(1, 10))
+@pytest.mark.parametrize("member_reserve", range(10))
+def test_identity_policy(max_group_size: int, member_reserve: int) -> None:
+    """The no policy places all users into groups by name."""
+    groups = identity_policy(USER_DATA, max_group_size, member_reserve)
+    assert_members_and_sizes(groups, set(USER_KEYS), max_group_size)
+    last_ident = ""
+    for group in groups:
+        group_idents = [USER_IDENTS[member] for member in group]
+        if group_idents:
+            assert last_ident < min(group_idents)
+            last_ident = max(group_idents)
+        else:
+            last_ident = chr(65536)
 
 
-def test_random_policy() -> None:
+@pytest.mark.parametrize("max_group_size", range(1, 10))
+@pytest.mark.parametrize("member_reserve", range(10))
+def test_random_policy(max_group_size: int, member_reserve: int) -> None:
     """The random policy places all users into groups."""
-    data = {}
-    for i in range(20):
-        data[User(UserKey(int=i), "user-%d" % i)] = UserPreferences()
-
-    for max_group_size in range(1, 10):
-        for member_reserve in range(10):
-            groups = random_policy(data, max_group_size, member_reserve)
-            users = cast(Set[UserKey], {user.key for user in data})
-            assert_members_and_sizes(groups, users, max_group_size)
+    groups = random_policy(USER_DATA, max_group_size, member_reserve)
+    assert_members_and_sizes(groups, set(USER_KEYS), max_group_size)
 
 
 def test_create_policy() -> None:
@@ -19,7 +19,7 @@
 
 """Base definitions for repositories."""
 
-from typing import Any, Dict, Iterable, NamedTuple, Optional, Sequence
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence
 
 from ..core.models import (Grouping, GroupingKey, Groups, Registration, User,
                            UserKey)
@@ -64,6 +64,10 @@ class Connection:  # pylint: disable=too-many-public-methods
         """Add / update the given user."""
         raise NotImplementedError("Connection.set_user")
 
+    def set_users(self, users: Iterable[User]) -> List[User]:
+        """Add / update the given users."""
+        raise NotImplementedError("Connection.set_users")
+
     def get_user(self, user_key: UserKey) -> Optional[User]:
         """Return user for given primary key."""
         raise NotImplementedError("Connection.get_user")
@@ -103,6 +107,10 @@ class Connection:  # pylint: disable=too-many-public-methods
         """Add / update the given grouping."""
         raise NotImplementedError("Connection.set_grouping")
 
+    def set_groupings(self, groupings: Iterable[Grouping]) -> List[Grouping]:
+        """Add / update the given groupings."""
+        raise NotImplementedError("Connection.set_groupings")
+
     def get_grouping(self, grouping_key: GroupingKey) -> Optional[Grouping]:
         """Return grouping with given key."""
         raise NotImplementedError("Connection.get_grouping")
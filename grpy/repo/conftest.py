@@ -22,13 +22,13 @@
 import os
 import tempfile
 from datetime import timedelta
-from typing import Any, Sequence
+from typing import Any, Iterator, Sequence, cast
 
 import pytest
 
-from ..core.models import Grouping, Permissions, User
+from ..core.models import Grouping, GroupingKey, Permissions, User, UserKey
 from ..core.utils import now
-from .base import Repository
+from .base import Connection, Repository
 from .dummy import DummyRepository
 from .ram import RamRepository
 from .sqlite import SqliteRepository
@@ -49,29 +49,23 @@ def _get_request_param() -> Sequence[Any]:
 # pylint: disable=redefined-outer-name
 
 
-@pytest.fixture(params=_get_request_param())
-def connection(request):
-    """
-    Provide an open connection.
-
-    Use the real repositories, and not the proxies, to allow for better
-    assert messages.
-    """
-    if request.param == "sqlite:///":
+def _create_connection(param: str) -> Iterator[Connection]:
+    """Create an open connection for a request parameter, close it afterwards."""
+    if param == "sqlite:///":
         with tempfile.NamedTemporaryFile(suffix=".sqlite3", delete=False) as temp_file:
             temp_file_name = temp_file.name
         repository: Repository = SqliteRepository("sqlite://" + temp_file_name)
         with_tempfile = True
     else:
-        if request.param == "ram:":
-            repository = RamRepository(request.param)
-        elif request.param == "dummy:":
-            repository = DummyRepository(request.param)
+        if param == "ram:":
+            repository = RamRepository(param)
+        elif param == "dummy:":
+            repository = DummyRepository(param)
         else:
-            assert request.param == "sqlite:"
+            assert param == "sqlite:"
             repository = SqliteRepository("sqlite:")
         with_tempfile = False
-        assert repository.url == request.param
+        assert repository.url == param
     repository.initialize()
 
     connection = repository.create()
@@ -82,6 +76,51 @@ def connection(request):
         os.unlink(temp_file.name)
 
 
+def _clear_connection(connection: Connection) -> None:
+    """Delete all data and pending messages stored via the connection."""
+    connection.get_messages()
+    for grouping in list(connection.iter_groupings()):
+        grouping_key = cast(GroupingKey, grouping.key)
+        connection.delete_registrations(grouping_key)
+        connection.set_groups(grouping_key, ())
+        connection.delete_grouping(grouping_key)
+    for user in list(connection.iter_users()):
+        connection.delete_user(cast(UserKey, user.key))
+
+
+@pytest.fixture(scope="module", params=_get_request_param())
+def shared_connection(request):
+    """Provide an open connection, to be cleared after every test."""
+    yield from _create_connection(request.param)
+
+
+@pytest.fixture
+def connection(shared_connection):
+    """
+    Provide an open connection without any stored data.
+
+    Use the real repositories, and not the proxies, to allow for better
+    assert messages.
+
+    The connection is shared by all tests of a module. Since the error state
+    of a connection cannot be reset, tests using it must not cause connection
+    errors.
+    """
+    yield shared_connection
+    assert not shared_connection.has_errors()
+    _clear_connection(shared_connection)
+
+
+@pytest.fixture(scope="module", params=_get_request_param())
+def module_connection(request):
+    """
+    Provide an open connection, shared by all tests of a module.
+
+    Tests using it must not change the stored data.
+    """
+    yield from _create_connection(request.param)
+
+
 @pytest.fixture
 def grouping(connection) -> Grouping:
     """Build a simple grouping object."""
@@ -21,7 +21,7 @@
 
 import dataclasses
 import json
-from typing import Any, List, Optional, Sequence, Tuple, cast
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, cast
 
 from ..core.logic import len_groups, make_code
 from ..core.models import (Grouping, GroupingKey, GroupingState, UserKey,
@@ -121,6 +121,19 @@ def _list_to_tuple(value: Any) -> Any:
     return value
 
 
+_FIELD_NAMES: Dict[Type[UserPreferences], Tuple[str, ...]] = {}
+
+
+def _field_names(preference_class: Type[UserPreferences]) -> Tuple[str, ...]:
+    """Return the names of all fields of the preference class."""
+    field_names = _FIELD_NAMES.get(preference_class)
+    if field_names is None:
+        field_names = tuple(
+            field.name for field in dataclasses.fields(preference_class))
+        _FIELD_NAMES[preference_class] = field_names
+    return field_names
+
+
 def decode_preferences(encoded: str) -> Optional[UserPreferences]:
     """Reconstruct user preferences from encoding."""
     try:
@@ -128,9 +141,9 @@ def decode_preferences(encoded: str) -> Optional[UserPreferences]:
         preference_class = get_preferences(value_dict['code'])
         if preference_class is None:
             return None
-        field_names = [field.name for field in dataclasses.fields(preference_class)]
         fields = value_dict['fields']
-        values = [_list_to_tuple(fields[name]) for name in field_names]
+        values = [
+            _list_to_tuple(fields[name]) for name in _field_names(preference_class)]
         result = preference_class(*values)
         return result
     except Exception:  # pylint: disable=broad-except
@@ -19,8 +19,10 @@
 
 """Proxy connection that implements WHERE and ORDER."""
 
+import functools
 import random
-from typing import Any, Callable, Iterable, Optional, Tuple, TypeVar, cast
+from typing import (Any, Callable, Iterable, List, Optional, Tuple, TypeVar,
+                    cast)
 
 from ...core.models import Grouping, GroupingKey, Model, User, UserKey
 from ..base import OrderSpec, WhereSpec
@@ -125,16 +127,47 @@ class WherePredicate:
         return cast(bool, data_value > self.value)
 
 
+def _compile_where_items(where_items: Iterable[Tuple[str, Any]]) -> Predicate:
+    """Build one predicate that is True if all specified predicates are True."""
+    preds: List[Predicate] = []
+    for where_spec, where_val in where_items:
+        where_field, where_relop = where_spec.split("__")
+        preds.append(WherePredicate(where_field, where_relop, where_val).pred())
+
+    def all_pred(data: Any) -> bool:
+        for pred in preds:
+            if not pred(data):
+                return False
+        return True
+
+    return all_pred
+
+
+_compile_where_cached = functools.lru_cache(maxsize=128)(_compile_where_items)
+
+
+def compile_where(where: Optional[WhereSpec]) -> Optional[Predicate]:
+    """
+    Compile a where specification into a single predicate.
+
+    Compiled predicates are cached, so that repeated queries with the same
+    where specification do not need to parse it again. Return None, if there
+    is nothing to filter.
+    """
+    if not where:
+        return None
+    try:
+        return _compile_where_cached(tuple(where.items()))
+    except TypeError:  # Some value is not hashable
+        return _compile_where_items(where.items())
+
+
 def process_where(
         result: Iterable[ModelT], where: Optional[WhereSpec]) -> Iterable[ModelT]:
     """Filter result according to specification."""
-    if where:
-        for where_spec, where_val in where.items():
-            where_spec_split = where_spec.split("__")
-            where_field = where_spec_split[0]
-            where_relop = where_spec_split[1]
-            pred = WherePredicate(where_field, where_relop, where_val).pred()
-            result = [elem for elem in result if pred(elem)]
+    pred = compile_where(where)
+    if pred:
+        return [elem for elem in result if pred(elem)]
     return result
 
 
@@ -20,7 +20,7 @@
 """Base proxy connection."""
 
 
-from typing import Iterable, Optional, Sequence
+from typing import Iterable, List, Optional, Sequence
 
 from ...core.models import (Grouping, GroupingKey, Groups, Registration, User,
                             UserKey)
@@ -51,6 +51,10 @@ class BaseProxyConnection(Connection):  # pylint: disable=too-many-public-method
         """Add / update the given user."""
         return self._delegate.set_user(user)
 
+    def set_users(self, users: Iterable[User]) -> List[User]:
+        """Add / update the given users."""
+        return self._delegate.set_users(users)
+
     def get_user(self, user_key: UserKey) -> Optional[User]:
         """Return user for given primary key."""
         return self._delegate.get_user(user_key)
@@ -74,6 +78,10 @@ class BaseProxyConnection(Connection):  # pylint: disable=too-many-public-method
         """Add / update the given grouping."""
         return self._delegate.set_grouping(grouping)
 
+    def set_groupings(self, groupings: Iterable[Grouping]) -> List[Grouping]:
+        """Add / update the given groupings."""
+        return self._delegate.set_groupings(groupings)
+
     def get_grouping(self, grouping_key: GroupingKey) -> Optional[Grouping]:
         """Return grouping with given key."""
         return self._delegate.get_grouping(grouping_key)
@@ -19,7 +19,7 @@
 
 """Checking proxy repositories."""
 
-from typing import Callable, List, Optional, Sequence
+from typing import Callable, Iterable, List, Optional, Sequence
 
 from ...core.models import (Grouping, GroupingKey, Groups, Registration, User,
                             UserKey, ValidationFailed)
@@ -36,11 +36,25 @@ class ValidatingProxyConnection(BaseProxyConnection):
         user.validate()
         return super().set_user(user)
 
+    def set_users(self, users: Iterable[User]) -> List[User]:
+        """Add / update the given users."""
+        users = list(users)
+        for user in users:
+            user.validate()
+        return super().set_users(users)
+
     def set_grouping(self, grouping: Grouping) -> Grouping:
         """Add / update the given grouping."""
         grouping.validate()
         return super().set_grouping(grouping)
 
+    def set_groupings(self, groupings: Iterable[Grouping]) -> List[Grouping]:
+        """Add / update the given groupings."""
+        groupings = list(groupings)
+        for grouping in groupings:
+            grouping.validate()
+        return super().set_groupings(groupings)
+
     def set_registration(self, registration: Registration) -> Registration:
         """Add / update a grouping registration."""
         registration.validate()
@@ -106,7 +120,7 @@ class CatchingProxyConnection(FilterProxyConnection):
 
     def get_messages(self) -> Sequence[Message]:
         """Return all repository-related messages."""
-        my_messages = list(self._messages)
+        my_messages = self._messages
         self._messages = []
         delegate_messages = super().get_messages()
         if delegate_messages:
@@ -20,7 +20,7 @@
 """Filter proxy connection."""
 
 from datetime import datetime
-from typing import Callable, Iterable, Optional, Sequence, cast
+from typing import Callable, Iterable, List, Optional, Sequence, cast
 
 from ...core.models import (Grouping, GroupingKey, Groups, Registration, User,
                             UserKey, UserPreferences)
@@ -65,6 +65,10 @@ class FilterProxyConnection(  # pylint: disable=too-many-public-methods
         """Add / update the given user."""
         return cast(User, self._filter(super().set_user, self._user, user))
 
+    def set_users(self, users: Iterable[User]) -> List[User]:
+        """Add / update the given users."""
+        return cast(List[User], self._filter(super().set_users, [], users))
+
     def get_user(self, user_key: UserKey) -> Optional[User]:
         """Return user for given primary key."""
         return cast(Optional[User], self._filter(super().get_user, None, user_key))
@@ -91,6 +95,11 @@ class FilterProxyConnection(  # pylint: disable=too-many-public-methods
         return cast(Grouping, self._filter(
             super().set_grouping, self._grouping, grouping))
 
+    def set_groupings(self, groupings: Iterable[Grouping]) -> List[Grouping]:
+        """Add / update the given groupings."""
+        return cast(List[Grouping], self._filter(
+            super().set_groupings, [], groupings))
+
     def get_grouping(self, grouping_key: GroupingKey) -> Optional[Grouping]:
         """Return grouping with given key."""
         return cast(Optional[Grouping], self._filter(
@@ -26,9 +26,11 @@ from ....core.models import Grouping, GroupingKey, Permissions, User, UserKey
 from ....core.utils import now
 from ...base import (Connection, OrderSpec, UserGroup, UserRegistration,
                      WhereSpec)
-from ..algebra import AlgebraConnection
+from ..algebra import AlgebraConnection, compile_where
 from ..base import BaseProxyConnection
 
+_YET = now()
+
 
 def test_ensure_iter_overwritten() -> None:
     """Make sure that all iter methods are overwritten by AlgebraConnection."""
@@ -58,7 +60,7 @@ class MockConnection(BaseProxyConnection):
             User(UserKey(int=1), "host", Permissions.HOST),
             User(UserKey(int=3), "user"),
             User(UserKey(int=2), "tsoh", Permissions.HOST),
-            User(UserKey(int=4), "active", Permissions.HOST, now()),
+            User(UserKey(int=4), "active", Permissions.HOST, _YET),
         )
 
     def iter_groupings(
@@ -72,13 +74,13 @@ class MockConnection(BaseProxyConnection):
         assert host.key is not None
         return (
             Grouping(
-                GroupingKey(int=2), "code-2", "grp-2", host.key, now(), now(),
-                now(), "P2", 6, 6, ""),
+                GroupingKey(int=2), "code-2", "grp-2", host.key, _YET, _YET,
+                _YET, "P2", 6, 6, ""),
             Grouping(
-                GroupingKey(int=3), "code-3", "grp-3", host.key, now(), now(),
+                GroupingKey(int=3), "code-3", "grp-3", host.key, _YET, _YET,
                 None, "P3", 3, 3, "3"),
             Grouping(
-                GroupingKey(int=4), "code-4", "grp-4", host.key, now(), now(),
+                GroupingKey(int=4), "code-4", "grp-4", host.key, _YET, _YET,
                 None, "P4", 4, 4, "4"),
         )
 
@@ -132,9 +134,10 @@ def test_iter_users_where() -> None:
     assert users[0].ident == "tsoh"
     assert list(connection.iter_users(where={'ident__lt': "active"})) == []
     assert list(connection.iter_users(where={'ident__gt': "user"})) == []
-    assert list(connection.iter_users(
-        where={'ident__le': "active"}))[0].ident == "active"
-    assert list(connection.iter_users(where={'ident__ge': "user"}))[0].ident == "user"
+    assert next(iter(connection.iter_users(
+        where={'ident__le': "active"}))).ident == "active"
+    assert next(iter(connection.iter_users(
+        where={'ident__ge': "user"}))).ident == "user"
 
 
 def test_iter_users_order() -> None:
@@ -162,7 +165,7 @@ def test_iter_groupings() -> None:
     assert len(list(connection.iter_groupings(
         where={'host_key__eq': UserKey(int=1)}))) == 3
     assert not connection.iter_groupings(where={'host_key__eq': UserKey(int=2)})
-    later = now() + timedelta(days=1)
+    later = _YET + timedelta(days=1)
     assert len(list(connection.iter_groupings(where={'close_date__le': later}))) == 3
     assert len(list(connection.iter_groupings(where={'close_date__lt': later}))) == 3
     assert len(list(connection.iter_groupings(where={'close_date__ge': later}))) == 2
@@ -183,3 +186,32 @@ def test_iter_user_registrations_by_grouping() -> None:
 def test_iter_groups_by_user() -> None:
     """Must delegate method call."""
     assert not get_connection(False).iter_groups_by_user(UserKey(int=0))
+
+
+def test_compile_where() -> None:
+    """A where specification is compiled into one cached predicate."""
+    assert compile_where(None) is None
+    assert compile_where({}) is None
+
+    pred = compile_where({'ident__ge': "h", 'permissions__eq': Permissions.HOST})
+    assert pred is not None
+    assert pred(User(UserKey(int=1), "host", Permissions.HOST))
+    assert not pred(User(UserKey(int=1), "active", Permissions.HOST))
+    assert not pred(User(UserKey(int=1), "user"))
+    assert pred is compile_where(
+        {'ident__ge': "h", 'permissions__eq': Permissions.HOST})
+
+    pred = compile_where({'ident__ne': ["unhashable"]})
+    assert pred is not None
+    assert pred(User(UserKey(int=1), "host"))
+
+
+def test_compile_where_order() -> None:
+    """Predicates are evaluated in the order of the where specification."""
+    grouping = Grouping(
+        GroupingKey(int=1), "code", "name", UserKey(int=2), _YET,
+        _YET + timedelta(days=1), _YET, "RD", 7, 7, "")
+    for _ in range(2):  # Compiled and cached
+        pred = compile_where({'close_date__eq': None, 'close_date__lt': None})
+        assert pred is not None
+        assert not pred(grouping)
@@ -66,6 +66,12 @@ def test_set_user(base_proxy: MockedBaseProxyConnection) -> None:
     assert base_proxy.mock.set_user.call_count == 1
 
 
+def test_set_users(base_proxy: MockedBaseProxyConnection) -> None:
+    """Add / update the given users."""
+    base_proxy.set_users([User(None, "ident")])
+    assert base_proxy.mock.set_users.call_count == 1
+
+
 def test_get_user(base_proxy: MockedBaseProxyConnection) -> None:
     """Return user for given primary key."""
     base_proxy.get_user(UserKey(int=0))
@@ -97,6 +103,13 @@ def test_set_grouping(
     assert base_proxy.mock.set_grouping.call_count == 1
 
 
+def test_set_groupings(
+        base_proxy: MockedBaseProxyConnection, grouping: Grouping) -> None:
+    """Add / update the given groupings."""
+    base_proxy.set_groupings([grouping])
+    assert base_proxy.mock.set_groupings.call_count == 1
+
+
 def test_get_grouping(base_proxy: MockedBaseProxyConnection) -> None:
     """Return grouping with given key."""
     base_proxy.get_grouping(GroupingKey(int=0))
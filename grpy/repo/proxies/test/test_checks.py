@@ -62,6 +62,17 @@ def test_validate_set_user(validate_proxy: MockedValidatingProxyConnection) -> N
     assert validate_proxy.mock.set_user.call_count == 1
 
 
+def test_validate_set_users(validate_proxy: MockedValidatingProxyConnection) -> None:
+    """Add / update the given users."""
+    with pytest.raises(ValidationFailed, match="Ident is empty: "):
+        validate_proxy.set_users([User(None, "."), User(None, "")])
+    assert validate_proxy.mock.set_users.call_count == 0
+
+    validate_proxy.set_users(iter([User(None, "."), User(None, ",")]))
+    assert validate_proxy.mock.set_users.call_count == 1
+    assert len(validate_proxy.mock.set_users.call_args[0][0]) == 2
+
+
 def test_validate_set_grouping(
         validate_proxy: MockedValidatingProxyConnection, grouping: Grouping) -> None:
     """Add / update the given grouping."""
@@ -73,6 +84,18 @@ def test_validate_set_grouping(
     assert validate_proxy.mock.set_grouping.call_count == 1
 
 
+def test_validate_set_groupings(
+        validate_proxy: MockedValidatingProxyConnection, grouping: Grouping) -> None:
+    """Add / update the given groupings."""
+    with pytest.raises(ValidationFailed, match="Maximum group size < 1: 0"):
+        validate_proxy.set_groupings(
+            [grouping, dataclasses.replace(grouping, max_group_size=0)])
+    assert validate_proxy.mock.set_groupings.call_count == 0
+
+    validate_proxy.set_groupings([grouping])
+    assert validate_proxy.mock.set_groupings.call_count == 1
+
+
 def test_validate_set_registration(
         validate_proxy: MockedValidatingProxyConnection) -> None:
     """Add / update a grouping registration."""
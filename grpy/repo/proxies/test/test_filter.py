@@ -92,6 +92,13 @@ def test_set_user(filter_proxy: MockedFilterProxyConnection) -> None:
     assert filter_proxy.filter_count == 1
 
 
+def test_set_users(filter_proxy: MockedFilterProxyConnection) -> None:
+    """Add / update the given users."""
+    filter_proxy.set_users([User(None, "ident")])
+    assert filter_proxy.mock.set_users.call_count == 1
+    assert filter_proxy.filter_count == 1
+
+
 def test_get_user(filter_proxy: MockedFilterProxyConnection) -> None:
     """Return user for given primary key."""
     filter_proxy.get_user(UserKey(int=0))
@@ -128,6 +135,14 @@ def test_set_grouping(
     assert filter_proxy.filter_count == 1
 
 
+def test_set_groupings(
+        filter_proxy: MockedFilterProxyConnection, grouping: Grouping) -> None:
+    """Add / update the given groupings."""
+    filter_proxy.set_groupings([grouping])
+    assert filter_proxy.mock.set_groupings.call_count == 1
+    assert filter_proxy.filter_count == 1
+
+
 def test_get_grouping(filter_proxy: MockedFilterProxyConnection) -> None:
     """Return grouping with given key."""
     filter_proxy.get_grouping(GroupingKey(int=0))
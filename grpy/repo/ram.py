@@ -20,7 +20,8 @@
 """In-memory repository, stored in RAM."""
 
 import dataclasses
-from typing import Dict, Iterable, Optional, Sequence, Tuple, cast
+from typing import (Any, Dict, Iterable, List, Optional, Sequence, Tuple,
+                    TypeVar, cast)
 
 from ..core.models import (Grouping, GroupingKey, Groups, Registration, User,
                            UserKey)
@@ -30,6 +31,18 @@ from .models import NamedUser, UserGroup, UserRegistration
 from .proxies.algebra import AlgebraConnection
 
 
+T = TypeVar('T')
+
+
+def _index_lookup(index: Dict[Any, T], value: Any) -> Iterable[T]:
+    """Return the element stored under the given value, or all if not hashable."""
+    try:
+        element = index.get(value)
+    except TypeError:
+        return index.values()
+    return [element] if element is not None else []
+
+
 class RamRepositoryState:  # pylint: disable=too-few-public-methods
     """The actual data stored for a RamRepository."""
 
@@ -94,23 +107,49 @@ class RamConnection(Connection):  # pylint: disable=too-many-public-methods
 
     def set_user(self, user: User) -> User:
         """Add / update the given user."""
+        previous_user = None
         if user.key:
             try:
                 previous_user = self._state.users[user.key]
             except KeyError:
                 raise NothingToUpdate("Missing user", user.key) from None
-            if previous_user.ident != user.ident:
-                del self._state.users_ident[previous_user.ident]
         else:
             user = dataclasses.replace(user, key=UserKey(int=self._state.next_int()))
 
         other_user = self._state.users_ident.get(user.ident)
         if other_user and user.key != other_user.key:
             raise DuplicateKey("User.ident", user.ident)
+        if previous_user and previous_user.ident != user.ident:
+            del self._state.users_ident[previous_user.ident]
         self._state.users[cast(UserKey, user.key)] = \
             self._state.users_ident[user.ident] = user
         return user
 
+    def set_users(self, users: Iterable[User]) -> List[User]:
+        """Add / update the given users, new users are added all at once."""
+        result: List[User] = []
+        new_users: Dict[str, User] = {}
+        for user in users:
+            if user.key:
+                self._add_users(new_users)
+                new_users = {}
+                result.append(self.set_user(user))
+                continue
+            if user.ident in self._state.users_ident or user.ident in new_users:
+                self._add_users(new_users)
+                raise DuplicateKey("User.ident", user.ident)
+            user = dataclasses.replace(user, key=UserKey(int=self._state.next_int()))
+            new_users[user.ident] = user
+            result.append(user)
+        self._add_users(new_users)
+        return result
+
+    def _add_users(self, users: Dict[str, User]) -> None:
+        """Add the given new users, indexed by their ident."""
+        self._state.users_ident.update(users)
+        self._state.users.update(
+            (cast(UserKey, user.key), user) for user in users.values())
+
     def get_user(self, user_key: UserKey) -> Optional[User]:
         """Return user with given key or None."""
         return self._state.users.get(user_key, None)
@@ -123,7 +162,12 @@ class RamConnection(Connection):  # pylint: disable=too-many-public-methods
             self,
             where: Optional[WhereSpec] = None,
             order: Optional[OrderSpec] = None) -> Iterable[User]:
-        """Return an iterator of all or some users."""
+        """Return an iterator of all or some users, use an index if possible."""
+        if where:
+            if 'key__eq' in where:
+                return _index_lookup(self._state.users, where['key__eq'])
+            if 'ident__eq' in where:
+                return _index_lookup(self._state.users_ident, where['ident__eq'])
         return self._state.users.values()
 
     def delete_user(self, user_key: UserKey) -> None:
@@ -135,13 +179,12 @@ class RamConnection(Connection):  # pylint: disable=too-many-public-methods
 
     def set_grouping(self, grouping: Grouping) -> Grouping:
         """Add / update the given grouping."""
+        previous_grouping = None
         if grouping.key:
             try:
                 previous_grouping = self._state.groupings[grouping.key]
             except KeyError:
                 raise NothingToUpdate("Missing grouping", grouping.key) from None
-            if previous_grouping.code != grouping.code:
-                del self._state.groupings_code[previous_grouping.code]
         else:
             grouping = dataclasses.replace(
                 grouping, key=GroupingKey(int=self._state.next_int()))
@@ -149,11 +192,41 @@ class RamConnection(Connection):  # pylint: disable=too-many-public-methods
         other_grouping = self._state.groupings_code.get(grouping.code)
         if other_grouping and grouping.key != other_grouping.key:
             raise DuplicateKey("Grouping.code", grouping.code)
+        if previous_grouping and previous_grouping.code != grouping.code:
+            del self._state.groupings_code[previous_grouping.code]
 
         self._state.groupings[cast(GroupingKey, grouping.key)] = \
             self._state.groupings_code[grouping.code] = grouping
         return grouping
 
+    def set_groupings(self, groupings: Iterable[Grouping]) -> List[Grouping]:
+        """Add / update the given groupings, new groupings are added all at once."""
+        result: List[Grouping] = []
+        new_groupings: Dict[str, Grouping] = {}
+        for grouping in groupings:
+            if grouping.key:
+                self._add_groupings(new_groupings)
+                new_groupings = {}
+                result.append(self.set_grouping(grouping))
+                continue
+            if grouping.code in self._state.groupings_code or \
+                    grouping.code in new_groupings:
+                self._add_groupings(new_groupings)
+                raise DuplicateKey("Grouping.code", grouping.code)
+            grouping = dataclasses.replace(
+                grouping, key=GroupingKey(int=self._state.next_int()))
+            new_groupings[grouping.code] = grouping
+            result.append(grouping)
+        self._add_groupings(new_groupings)
+        return result
+
+    def _add_groupings(self, groupings: Dict[str, Grouping]) -> None:
+        """Add the given new groupings, indexed by their code."""
+        self._state.groupings_code.update(groupings)
+        self._state.groupings.update(
+            (cast(GroupingKey, grouping.key), grouping)
+            for grouping in groupings.values())
+
     def get_grouping(self, grouping_key: GroupingKey) -> Optional[Grouping]:
         """Return grouping with given key."""
         return self._state.groupings.get(grouping_key, None)
@@ -166,7 +239,12 @@ class RamConnection(Connection):  # pylint: disable=too-many-public-methods
             self,
             where: Optional[WhereSpec] = None,
             order: Optional[OrderSpec] = None) -> Iterable[Grouping]:
-        """Return an iterator of all or some groupings."""
+        """Return an iterator of all or some groupings, use an index if possible."""
+        if where:
+            if 'key__eq' in where:
+                return _index_lookup(self._state.groupings, where['key__eq'])
+            if 'code__eq' in where:
+                return _index_lookup(self._state.groupings_code, where['code__eq'])
         return self._state.groupings.values()
 
     def delete_grouping(self, grouping_key: GroupingKey) -> None:
@@ -227,7 +305,10 @@ class RamConnection(Connection):  # pylint: disable=too-many-public-methods
 
     def set_groups(self, grouping_key: GroupingKey, groups: Groups) -> None:
         """Set / replace groups builded for grouping."""
-        self._state.groups[grouping_key] = groups
+        if groups:
+            self._state.groups[grouping_key] = groups
+        else:
+            self._state.groups.pop(grouping_key, None)
 
     def get_groups(self, grouping_key: GroupingKey) -> Groups:
         """Get groups builded for grouping."""
@@ -73,8 +73,13 @@ class SqliteRepository(Repository):
         if self._database:
             try:
                 connection = sqlite3.connect(
-                    self._database, detect_types=sqlite3.PARSE_DECLTYPES)
+                    self._database, detect_types=sqlite3.PARSE_DECLTYPES,
+                    isolation_level=None)
                 connection.execute("PRAGMA foreign_keys=ON")
+                connection.execute("PRAGMA journal_mode=WAL")
+                # With WAL, NORMAL stays consistent, but the last commits may be
+                # lost on power loss. This is accepted for fewer fsyncs.
+                connection.execute("PRAGMA synchronous=NORMAL")
                 connection.execute("BEGIN TRANSACTION")
                 return connection
             except Exception:  # pylint: disable=broad-except
@@ -82,7 +87,8 @@ class SqliteRepository(Repository):
 
         if not self._connection:
             self._connection = sqlite3.connect(
-                ":memory:", detect_types=sqlite3.PARSE_DECLTYPES)
+                ":memory:", detect_types=sqlite3.PARSE_DECLTYPES,
+                isolation_level=None)
             self._connection.execute("PRAGMA foreign_keys = ON")
         return self._connection
 
@@ -155,6 +161,8 @@ CREATE INDEX idx_groups ON groups(grouping_key)
                 cursor.execute("COMMIT")
         finally:
             cursor.close()
+            if self._database:
+                connection.close()
         return True
 
     def create(self) -> Connection:
@@ -201,6 +209,28 @@ class SqliteConnection(Connection):  # pylint: disable=too-many-public-methods
             raise TypeError("SQLite connection is None")
         return self._connection.execute(sql, values)
 
+    def _executemany(
+            self, sql: str, values: Iterable[Sequence[Any]]) -> sqlite3.Cursor:
+        """
+        Execute a SQL command for a sequence of values.
+
+        Outside of a transaction, i.e. for the in-memory database, the whole
+        batch runs in one transaction instead of one transaction per value.
+        """
+        if self._connection is None:
+            raise TypeError("SQLite connection is None")
+        if self._connection.in_transaction:
+            return self._connection.executemany(sql, values)
+        self._connection.execute("BEGIN TRANSACTION")
+        try:
+            cursor = self._connection.executemany(sql, values)
+        except sqlite3.Error:
+            if self._connection.in_transaction:
+                self._connection.execute("COMMIT")
+            raise
+        self._connection.execute("COMMIT")
+        return cursor
+
     def set_user(self, user: User) -> User:
         """Add / update the given user."""
         if user.key:
@@ -231,6 +261,40 @@ class SqliteConnection(Connection):  # pylint: disable=too-many-public-methods
             raise
         return dataclasses.replace(user, key=user_key)
 
+    def set_users(self, users: Iterable[User]) -> List[User]:
+        """Add / update the given users, new users are inserted all at once."""
+        result: List[User] = []
+        new_users: List[User] = []
+        for user in users:
+            if user.key:
+                self._insert_users(new_users)
+                new_users = []
+                result.append(self.set_user(user))
+            else:
+                user = dataclasses.replace(user, key=UserKey())
+                new_users.append(user)
+                result.append(user)
+        self._insert_users(new_users)
+        return result
+
+    def _insert_users(self, users: List[User]) -> None:
+        """Insert the given new users, which already have a key."""
+        if not users:
+            return
+        try:
+            self._executemany(
+                "INSERT INTO users(key,ident,permissions,last_login) VALUES(?,?,?,?)",
+                [(user.key, user.ident, user.permissions.value, user.last_login)
+                 for user in users])
+        except sqlite3.IntegrityError as exc:
+            if exc.args[0] == 'UNIQUE constraint failed: users.ident':
+                # Users are inserted in order, the first missing one failed
+                ident = next(
+                    user.ident for user in users
+                    if not self.get_user(cast(UserKey, user.key)))
+                raise DuplicateKey("User.ident", ident) from None
+            raise
+
     def get_user(self, user_key: UserKey) -> Optional[User]:
         """Return user with given key or None."""
         cursor = self._execute(
@@ -306,6 +370,43 @@ class SqliteConnection(Connection):  # pylint: disable=too-many-public-methods
             raise
         return dataclasses.replace(grouping, key=grouping_key)
 
+    def set_groupings(self, groupings: Iterable[Grouping]) -> List[Grouping]:
+        """Add / update the given groupings, new groupings are inserted all at once."""
+        result: List[Grouping] = []
+        new_groupings: List[Grouping] = []
+        for grouping in groupings:
+            if grouping.key:
+                self._insert_groupings(new_groupings)
+                new_groupings = []
+                result.append(self.set_grouping(grouping))
+            else:
+                grouping = dataclasses.replace(grouping, key=GroupingKey())
+                new_groupings.append(grouping)
+                result.append(grouping)
+        self._insert_groupings(new_groupings)
+        return result
+
+    def _insert_groupings(self, groupings: List[Grouping]) -> None:
+        """Insert the given new groupings, which already have a key."""
+        if not groupings:
+            return
+        try:
+            self._executemany(
+                "INSERT INTO groupings VALUES(?,?,?,?,?,?,?,?,?,?,?)",
+                [(grouping.key, grouping.code, grouping.name, grouping.host_key,
+                  grouping.begin_date, grouping.final_date, grouping.close_date,
+                  grouping.policy, grouping.max_group_size,
+                  grouping.member_reserve, grouping.note)
+                 for grouping in groupings])
+        except sqlite3.IntegrityError as exc:
+            if exc.args[0] == 'UNIQUE constraint failed: groupings.code':
+                # Groupings are inserted in order, the first missing one failed
+                code = next(
+                    grouping.code for grouping in groupings
+                    if not self.get_grouping(cast(GroupingKey, grouping.key)))
+                raise DuplicateKey("Grouping.code", code) from None
+            raise
+
     def get_grouping(self, grouping_key: GroupingKey) -> Optional[Grouping]:
         """Return grouping with given key."""
         cursor = self._execute(
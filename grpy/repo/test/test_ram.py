@@ -19,7 +19,12 @@
 
 """Test the specifics of RAM-based repositories."""
 
-from ..ram import RamRepository
+from datetime import timedelta
+from typing import cast
+
+from ...core.models import Grouping, User, UserKey
+from ...core.utils import now
+from ..ram import RamConnection, RamRepository, RamRepositoryState
 
 
 def test_url() -> None:
@@ -43,3 +48,25 @@ def test_different_repositories_different_connections() -> None:
     connection_2 = repository_2.create()
     assert connection_1 is not connection_2
     assert connection_1 != connection_2
+
+
+def test_iter_by_index() -> None:
+    """Equality on a key, ident, or code is answered by an index."""
+    connection = RamConnection(RamRepositoryState())
+    user = connection.set_user(User(None, "user"))
+    connection.set_user(User(None, "other"))
+    assert list(connection.iter_users(where={'key__eq': user.key})) == [user]
+    assert list(connection.iter_users(where={'ident__eq': "user"})) == [user]
+    assert not connection.iter_users(where={'ident__eq': "unknown"})
+    assert len(list(connection.iter_users(where={'ident__eq': ["user"]}))) == 2
+
+    yet = now()
+    grouping = connection.set_grouping(Grouping(
+        None, ".code", "g-name", cast(UserKey, user.key),
+        yet, yet + timedelta(days=7), None, "RD", 7, 7, ""))
+    assert list(connection.iter_groupings(
+        where={'key__eq': grouping.key})) == [grouping]
+    assert list(connection.iter_groupings(
+        where={'code__eq': grouping.code})) == [grouping]
+    assert not connection.iter_groupings(where={'code__eq': "unknown"})
+    assert list(connection.iter_groupings(where={'code__eq': [".code"]})) == [grouping]
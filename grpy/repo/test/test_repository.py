@@ -21,21 +21,45 @@
 
 import dataclasses
 import datetime
+import operator
 import random
-from typing import List, Tuple, cast
+from typing import Callable, Iterable, List, NamedTuple, Optional, Tuple, TypeVar, cast
 
 import pytest
+import pytz
 
 from ...core import utils
 from ...core.models import (Grouping, GroupingKey, Groups, Permissions,
                             Registration, User, UserKey, UserPreferences)
 from ...core.preferences import register_preferences
 from .. import create_repository
-from ..base import Connection, DuplicateKey, NothingToUpdate
+from ..base import Connection, DuplicateKey, NothingToUpdate, WhereSpec
 from ..ram import RamRepository
 
 # pylint: disable=redefined-outer-name
 
+T = TypeVar("T")
+
+USER_FIELD_KEYS = tuple(
+    (field.name + "__eq", field.name + "__ne") for field in dataclasses.fields(User))
+
+CORPUS_SIZE = 13
+CORPUS_POSITIONS = (0, CORPUS_SIZE // 2, CORPUS_SIZE - 1)
+
+
+def by_key(elements: Iterable[T]) -> List[T]:
+    """Return the given users or groupings as a list, sorted by their key."""
+    return sorted(elements, key=lambda element: element.key)  # type: ignore
+
+
+@pytest.fixture(autouse=True, scope="module")
+def fixed_now():
+    """Let `utils.now()` return a constant time for all tests of this module."""
+    yet = datetime.datetime(2020, 1, 1, tzinfo=pytz.UTC)
+    with pytest.MonkeyPatch.context() as mpatch:
+        mpatch.setattr(utils, "now", lambda: yet)
+        yield yet
+
 
 def test_wrong_repository_url() -> None:
     """If an illegal URL ist given, a dummy repository must be returned."""
@@ -44,12 +68,9 @@ def test_wrong_repository_url() -> None:
     assert create_repository("").url == "dummy:"
 
 
-def test_no_connection(monkeypatch) -> None:
+def test_no_connection() -> None:
     """If unable to connect to data store, a dummy repository must be returned."""
-    def return_false(_):
-        return False
-    monkeypatch.setattr(RamRepository, "can_connect", return_false)
-    repository = create_repository("ram:")
+    repository = create_repository("sqlite://./\0")
     assert repository.url == "dummy:"
 
 
@@ -101,6 +122,27 @@ def test_update_user(connection: Connection) -> None:
     renamed_user = dataclasses.replace(user_2, ident=user.ident)
     with pytest.raises(DuplicateKey, match="User.ident"):
         connection.set_user(renamed_user)
+    assert connection.get_user_by_ident(user_2.ident) == user_2
+
+
+def test_set_users(connection: Connection) -> None:
+    """Insert and update some users at once."""
+    assert connection.set_users([]) == []
+
+    user = connection.set_user(User(None, "user"))
+    renamed_user = dataclasses.replace(user, ident="renamed")
+    users = connection.set_users(
+        [User(None, "user-1"), renamed_user, User(None, "user")])
+    assert users[1] == renamed_user
+    for new_user in users:
+        assert new_user.key
+        assert connection.get_user_by_ident(new_user.ident) == new_user
+    assert connection.get_user(cast(UserKey, user.key)) == renamed_user
+
+    with pytest.raises(DuplicateKey, match="User.ident") as exc_info:
+        connection.set_users([User(None, "user-2"), User(None, "user-2")])
+    assert exc_info.value.args[1] == "user-2"
+    assert connection.get_user_by_ident("user-2") is not None
 
 
 def test_get_user(connection: Connection) -> None:
@@ -116,7 +158,12 @@ def test_get_user(connection: Connection) -> None:
     assert last_user is not None
     assert last_user.is_host != user.is_host
 
-    assert connection.get_user(UserKey()) is None
+
+@pytest.mark.parametrize("user_key", [UserKey(int=0), UserKey()])
+def test_get_user_not_found(connection: Connection, user_key: UserKey) -> None:
+    """An unknown user key will not be found."""
+    connection.set_user(User(None, "user"))
+    assert connection.get_user(user_key) is None
 
 
 def test_get_user_by_ident(connection: Connection) -> None:
@@ -131,9 +178,12 @@ def test_get_user_by_ident(connection: Connection) -> None:
     assert last_user is not None
     assert last_user.is_host != user.is_host
 
-    for ident in ("", "invalid"):
-        not_found = connection.get_user_by_ident(ident)
-        assert not_found is None
+
+@pytest.mark.parametrize("ident", ["", "invalid"])
+def test_get_user_by_ident_not_found(connection: Connection, ident: str) -> None:
+    """An unknown ident will not be found."""
+    connection.set_user(User(None, "user"))
+    assert connection.get_user_by_ident(ident) is None
 
 
 def test_get_user_by_ident_change(connection: Connection) -> None:
@@ -149,75 +199,95 @@ def test_get_user_by_ident_change(connection: Connection) -> None:
 
 def setup_users(connection: Connection, count: int) -> List[User]:
     """Insert some users into repository."""
-    result = []
+    users = []
     permissions = Permissions(0)
+    now = utils.now()
     for i in range(count):
-        user = connection.set_user(User(None, "user-%d" % i, permissions, utils.now()))
-        result.append(user)
+        users.append(User(None, "user-%d" % i, permissions, now))
         permissions = Permissions(0) if permissions else Permissions.HOST
-    return result
+    return connection.set_users(users)
+
+
+class Corpus(NamedTuple):
+    """Users and groupings, stored in a shared connection, sorted by their key."""
 
+    connection: Connection
+    users: List[User]
+    groupings: List[Grouping]
 
-def test_iter_users(connection: Connection) -> None:
+
+@pytest.fixture(scope="module")
+def corpus(module_connection: Connection) -> Corpus:
+    """
+    Provide a connection with some users and groupings.
+
+    The corpus is shared by all tests of this module, so it must not be changed.
+    """
+    users = setup_users(module_connection, CORPUS_SIZE)
+    hosts = [user for user in users if user.is_host][:2]
+    groupings = setup_groupings(module_connection, CORPUS_SIZE, hosts)
+    return Corpus(module_connection, by_key(users), by_key(groupings))
+
+
+def test_iter_users(corpus: Corpus) -> None:
     """List all users."""
-    all_users = setup_users(connection, 17)
-    iter_users = utils.LazyList(connection.iter_users())
-    assert len(iter_users) == len(all_users)
-    assert set(iter_users) == set(all_users)
+    connection, all_users, _ = corpus
+    assert by_key(connection.iter_users()) == all_users
 
 
-def test_iter_users_where(connection: Connection) -> None:
+def test_iter_users_where(corpus: Corpus) -> None:
     """Select some user from list of all users."""
-    all_users = setup_users(connection, 13)
+    connection, all_users, _ = corpus
     users = list(connection.iter_users(where={'permissions__eq': Permissions.HOST}))
     non_users = list(connection.iter_users(where={'permissions__ne': Permissions.HOST}))
-    assert len(users) + len(non_users) == len(all_users)
-    assert set(users + non_users) == set(all_users)
-
-    for field in dataclasses.fields(User):
-        field_name = field.name
-        field_value = None
-        where = {field_name + "__eq": field_value}
-        lazy_users = utils.LazyList(connection.iter_users(where=where))
-        assert not lazy_users
-        where = {field_name + "__ne": field_value}
-        lazy_users = utils.LazyList(connection.iter_users(where=where))
-        assert set(lazy_users) == set(all_users)
-
-    for _ in range(len(all_users)):
-        user = random.choice(all_users)
-        users = list(connection.iter_users(where={'ident__eq': user.ident}))
-        assert len(users) == 1
-        assert users[0] == user
-
-        other_users = list(connection.iter_users(where={'ident__ne': user.ident}))
-        assert len(other_users) + 1 == len(all_users)
-        assert set(other_users + users) == set(all_users)
-
-        users = list(connection.iter_users(where={'ident__lt': user.ident}))
-        non_users = list(connection.iter_users(where={'ident__ge': user.ident}))
-        assert len(users) + len(non_users) == len(all_users)
-        assert set(users + non_users) == set(all_users)
-
-        users = list(connection.iter_users(where={'ident__gt': user.ident}))
-        non_users = list(connection.iter_users(where={'ident__le': user.ident}))
-        assert len(users) + len(non_users) == len(all_users)
-        assert set(users + non_users) == set(all_users)
-
-        no_users = utils.LazyList(connection.iter_users(
-            where={'key__eq': UserKey()}))
-        assert not no_users
-
-
-def test_iter_users_order(connection: Connection) -> None:
+    assert by_key(users + non_users) == all_users
+
+    no_users = utils.LazyList(connection.iter_users(where={'key__eq': UserKey()}))
+    assert not no_users
+
+
+@pytest.mark.parametrize("eq_key,ne_key", USER_FIELD_KEYS)
+def test_iter_users_where_none(corpus: Corpus, eq_key: str, ne_key: str) -> None:
+    """No user field of the corpus is None."""
+    connection, all_users, _ = corpus
+    assert not utils.LazyList(connection.iter_users(where={eq_key: None}))
+    users = connection.iter_users(where={ne_key: None})
+    assert by_key(users) == all_users
+
+
+@pytest.mark.parametrize("position", CORPUS_POSITIONS)
+def test_iter_users_equality(corpus: Corpus, position: int) -> None:
+    """Select users by equality of their ident."""
+    connection, all_users, _ = corpus
+    user = sorted(all_users, key=lambda user: user.ident)[position]
+    users = list(connection.iter_users(where={'ident__eq': user.ident}))
+    assert users == [user]
+
+    other_users = connection.iter_users(where={'ident__ne': user.ident})
+    assert by_key(other_users) == [
+        other for other in all_users if other.ident != user.ident]
+
+
+@pytest.mark.parametrize("relop,compare", [
+    ("lt", operator.lt), ("le", operator.le), ("gt", operator.gt), ("ge", operator.ge),
+])
+@pytest.mark.parametrize("position", CORPUS_POSITIONS)
+def test_iter_users_range(
+        corpus: Corpus, relop: str, compare: Callable, position: int) -> None:
+    """Select users by an order relation of their ident."""
+    connection, all_users, _ = corpus
+    user = sorted(all_users, key=lambda user: user.ident)[position]
+    users = connection.iter_users(where={'ident__' + relop: user.ident})
+    assert by_key(users) == [
+        other for other in all_users if compare(other.ident, user.ident)]
+
+
+@pytest.mark.parametrize("order,reverse", [
+    ("ident", False), ("+ident", False), ("-ident", True)])
+def test_iter_users_order(corpus: Corpus, order: str, reverse: bool) -> None:
     """Order the list of users."""
-    all_users = setup_users(connection, 7)  # Must be less than 10
-    users = list(connection.iter_users(order=["ident"]))
-    assert users == all_users
-    users = list(connection.iter_users(order=["+ident"]))
-    assert users == all_users
-    users = list(connection.iter_users(order=["-ident"]))
-    assert users == list(reversed(all_users))
+    all_users = sorted(corpus.users, key=lambda user: user.ident, reverse=reverse)
+    assert list(corpus.connection.iter_users(order=[order])) == all_users
 
 
 def test_delete_user(connection: Connection) -> None:
@@ -277,6 +347,25 @@ def test_update_grouping_duplicate(connection: Connection, grouping: Grouping) -
         dataclasses.replace(grouping, key=None, code=grouping.code[::-1]))
     with pytest.raises(DuplicateKey, match="Grouping.code"):
         connection.set_grouping(dataclasses.replace(grouping_2, code=grouping.code))
+    assert connection.get_grouping_by_code(grouping_2.code) == grouping_2
+
+
+def test_set_groupings(connection: Connection, grouping: Grouping) -> None:
+    """Insert and update some groupings at once."""
+    assert connection.set_groupings([]) == []
+
+    stored_grouping = connection.set_grouping(grouping)
+    renamed_grouping = dataclasses.replace(stored_grouping, name="new name")
+    groupings = connection.set_groupings([
+        dataclasses.replace(grouping, code=grouping.code[::-1]), renamed_grouping])
+    assert groupings[1] == renamed_grouping
+    for new_grouping in groupings:
+        assert new_grouping.key
+        assert connection.get_grouping_by_code(new_grouping.code) == new_grouping
+
+    with pytest.raises(DuplicateKey, match="Grouping.code") as exc_info:
+        connection.set_groupings([grouping])
+    assert exc_info.value.args[1] == grouping.code
 
 
 def test_get_grouping(connection: Connection, grouping: Grouping) -> None:
@@ -292,7 +381,14 @@ def test_get_grouping(connection: Connection, grouping: Grouping) -> None:
     assert last_grouping is not None
     assert last_grouping.name != grouping.name
 
-    assert connection.get_grouping(GroupingKey()) is None
+
+@pytest.mark.parametrize(
+    "grouping_key", [GroupingKey(int=0), GroupingKey()])
+def test_get_grouping_not_found(
+        connection: Connection, grouping: Grouping, grouping_key: GroupingKey) -> None:
+    """An unknown grouping key will not be found."""
+    connection.set_grouping(grouping)
+    assert connection.get_grouping(grouping_key) is None
 
 
 def test_get_grouping_by_code(connection: Connection, grouping: Grouping) -> None:
@@ -308,9 +404,8 @@ def test_get_grouping_by_code(connection: Connection, grouping: Grouping) -> Non
     assert last_grouping is not None
     assert last_grouping.name != grouping.name
 
-    for ident in ("", "invalid"):
-        not_found = connection.get_user_by_ident(ident)
-        assert not_found is None
+    for code in ("", "invalid"):
+        assert connection.get_grouping_by_code(code) is None
 
 
 def test_get_grouping_by_code_after_change(
@@ -321,87 +416,87 @@ def test_get_grouping_by_code_after_change(
     assert connection.get_grouping_by_code(grouping.code) is None
 
 
-def setup_groupings(connection: Connection, count: int) -> List[Grouping]:
+def setup_groupings(
+        connection: Connection,
+        count: int,
+        hosts: Optional[List[User]] = None) -> List[Grouping]:
     """Insert some groupings into repository."""
-    hosts = [
-        connection.set_user(User(None, "host-1", Permissions.HOST)),
-        connection.set_user(User(None, "host-2", Permissions.HOST)),
-    ]
+    if not hosts:
+        hosts = connection.set_users([
+            User(None, "host-1", Permissions.HOST),
+            User(None, "host-2", Permissions.HOST),
+        ])
     for host in hosts:
         assert host.key is not None
     now = utils.now()
-    timedelta = datetime.timedelta
-    days = 0
-    result = []
+    one_week = datetime.timedelta(days=7)
+    groupings = []
     for i in range(count):
-        grouping = connection.set_grouping(Grouping(
+        begin_date = now + datetime.timedelta(days=i)
+        groupings.append(Grouping(
             None, "cd%d" % i, "grouping-%d" % i,
-            cast(UserKey, hosts[days % len(hosts)].key),
-            now + timedelta(days=days), now + timedelta(days=days + 7), None,
-            "RD", days + 1, 5, "Note %d" % i))
-        result.append(grouping)
-        days += 1
-    return result
+            cast(UserKey, hosts[i % len(hosts)].key),
+            begin_date, begin_date + one_week, None, "RD", i + 1, 5, "Note %d" % i))
+    return connection.set_groupings(groupings)
 
 
-def test_iter_groupings(connection: Connection) -> None:
+def test_iter_groupings(corpus: Corpus) -> None:
     """List all groupings."""
-    all_groupings = setup_groupings(connection, 17)
-    iter_groupings = utils.LazyList(connection.iter_groupings())
-    assert len(iter_groupings) == len(all_groupings)
-    assert set(iter_groupings) == set(all_groupings)
+    connection, _, all_groupings = corpus
+    assert by_key(connection.iter_groupings()) == all_groupings
 
 
-def test_iter_groupings_where(connection: Connection) -> None:
+def test_iter_groupings_where(corpus: Corpus) -> None:
     """Select some grouping from list of all groupings."""
-    all_groupings = setup_groupings(connection, 13)
+    connection, _, all_groupings = corpus
     groupings = list(connection.iter_groupings(where={'close_date__eq': None}))
     non_groupings = list(connection.iter_groupings(where={'close_date__ne': None}))
-    assert len(groupings) + len(non_groupings) == len(all_groupings)
-    assert set(groupings + non_groupings) == set(all_groupings)
-
-    groupings = list(connection.iter_groupings(where={'close_date__lt': utils.now()}))
-    assert set(groupings) == set(all_groupings)
-    groupings = list(connection.iter_groupings(where={'close_date__le': utils.now()}))
-    assert set(groupings) == set(all_groupings)
-
-    for _ in range(len(all_groupings)):
-        grouping = random.choice(all_groupings)
-        groupings = list(connection.iter_groupings(where={'name__eq': grouping.name}))
-        assert len(groupings) == 1
-        assert groupings[0] == grouping
-
-        other_groupings = list(
-            connection.iter_groupings(where={'name__ne': grouping.name}))
-        assert len(other_groupings) + 1 == len(all_groupings)
-        assert set(other_groupings + groupings) == set(all_groupings)
-
-        groupings = list(connection.iter_groupings(where={
-            'close_date__lt': None, 'close_date__ne': None}))
-        non_groupings = list(connection.iter_groupings(where={'close_date__ge': None}))
-        assert len(groupings) + len(non_groupings) == len(all_groupings)
-        assert set(groupings + non_groupings) == set(all_groupings)
-
-        groupings = list(connection.iter_groupings(where={'close_date__gt': None}))
-        non_groupings = list(connection.iter_groupings(where={
-            'close_date__le': None, 'close_date__ne': None}))
-        assert len(groupings) + len(non_groupings) == len(all_groupings)
-        assert set(groupings + non_groupings) == set(all_groupings)
-
-        no_groupings = utils.LazyList(connection.iter_groupings(
-            where={'key__eq': GroupingKey()}))
-        assert not no_groupings
-
-
-def test_iter_groupings_order(connection: Connection) -> None:
+    assert by_key(groupings + non_groupings) == all_groupings
+
+    now = utils.now()
+    groupings = list(connection.iter_groupings(where={'close_date__lt': now}))
+    assert by_key(groupings) == all_groupings
+    groupings = list(connection.iter_groupings(where={'close_date__le': now}))
+    assert by_key(groupings) == all_groupings
+
+    no_groupings = utils.LazyList(connection.iter_groupings(
+        where={'key__eq': GroupingKey()}))
+    assert not no_groupings
+
+
+@pytest.mark.parametrize("position", CORPUS_POSITIONS)
+def test_iter_groupings_equality(corpus: Corpus, position: int) -> None:
+    """Select groupings by equality of their name."""
+    connection, _, all_groupings = corpus
+    grouping = sorted(all_groupings, key=lambda grouping: grouping.name)[position]
+    groupings = list(connection.iter_groupings(where={'name__eq': grouping.name}))
+    assert groupings == [grouping]
+
+    other_groupings = connection.iter_groupings(where={'name__ne': grouping.name})
+    assert by_key(other_groupings) == [
+        other for other in all_groupings if other.name != grouping.name]
+
+
+@pytest.mark.parametrize("where,other_where", [
+    ({'close_date__lt': None, 'close_date__ne': None}, {'close_date__ge': None}),
+    ({'close_date__gt': None}, {'close_date__le': None, 'close_date__ne': None}),
+])
+def test_iter_groupings_range(
+        corpus: Corpus, where: WhereSpec, other_where: WhereSpec) -> None:
+    """Select groupings by complementary order relations with None."""
+    connection, _, all_groupings = corpus
+    groupings = list(connection.iter_groupings(where=where))
+    non_groupings = list(connection.iter_groupings(where=other_where))
+    assert by_key(groupings + non_groupings) == all_groupings
+
+
+@pytest.mark.parametrize("order,reverse", [
+    ("name", False), ("+name", False), ("-name", True)])
+def test_iter_groupings_order(corpus: Corpus, order: str, reverse: bool) -> None:
     """Order the list of groupings."""
-    all_groupings = setup_groupings(connection, 7)  # Must be less than 10
-    groupings = list(connection.iter_groupings(order=["name"]))
-    assert groupings == all_groupings
-    groupings = list(connection.iter_groupings(order=["+name"]))
-    assert groupings == all_groupings
-    groupings = list(connection.iter_groupings(order=["-name"]))
-    assert groupings == list(reversed(all_groupings))
+    all_groupings = sorted(
+        corpus.groupings, key=lambda grouping: grouping.name, reverse=reverse)
+    assert list(corpus.connection.iter_groupings(order=[order])) == all_groupings
 
 
 def test_delete_grouping(connection: Connection, grouping: Grouping) -> None:
@@ -474,12 +569,13 @@ def test_count_registrations_by_grouping(
     assert grouping.key is not None
     assert connection.count_registrations_by_grouping(grouping.key) == 0
 
-    for i in range(10):
-        user = connection.set_user(User(None, "USeR" + str(i)))
-        assert user.key is not None
+    users = connection.set_users(User(None, "USeR" + str(i)) for i in range(10))
+    for num, user in enumerate(users):
         connection.set_registration(Registration(
-            grouping.key, user.key, UserPreferences()))
-        assert connection.count_registrations_by_grouping(grouping.key) == i + 1
+            grouping.key, cast(UserKey, user.key), UserPreferences()))
+        if num == 0:
+            assert connection.count_registrations_by_grouping(grouping.key) == 1
+    assert connection.count_registrations_by_grouping(grouping.key) == len(users)
 
 
 def test_delete_registration(connection: Connection, grouping: Grouping) -> None:
@@ -498,22 +594,35 @@ def test_delete_registration(connection: Connection, grouping: Grouping) -> None
     assert connection.get_registration(grouping.key, user.key) is None
 
 
-def test_iter_groupings_by_user(connection: Connection, grouping: Grouping) -> None:
-    """List only applied groupings."""
+@pytest.fixture
+def stored_groupings(
+        connection: Connection, grouping: Grouping) -> Tuple[Grouping, Grouping]:
+    """Store the grouping and another one."""
     other_grouping = dataclasses.replace(grouping, code="newcode", name="Another name")
     assert grouping != other_grouping
     grouping = connection.set_grouping(grouping)
     assert grouping.key is not None
     other_grouping = connection.set_grouping(other_grouping)
     assert other_grouping.key != grouping.key
-    for uid in range(5):
-        user = connection.set_user(User(None, "USER" + str(uid)))
-        assert user.key is not None
+    return (grouping, other_grouping)
+
+
+@pytest.mark.parametrize("uid", [0, 4])
+def test_iter_groupings_by_user(
+        connection: Connection,
+        stored_groupings: Tuple[Grouping, Grouping],
+        uid: int) -> None:
+    """List only applied groupings, for the first and for the last registrant."""
+    grouping = stored_groupings[0]
+    assert grouping.key is not None
+    for i in range(uid + 1):
+        user = connection.set_user(User(None, "USER" + str(i)))
+        user_key = cast(UserKey, user.key)
         connection.set_registration(Registration(
-            grouping.key, user.key, UserPreferences()))
-        assert [grouping] == list(connection.iter_groupings_by_user(user.key))
-        assert list(connection.iter_groupings_by_user(
-            user.key, where={'name__ne': grouping.name})) == []
+            grouping.key, user_key, UserPreferences()))
+    assert [grouping] == list(connection.iter_groupings_by_user(user_key))
+    assert list(connection.iter_groupings_by_user(
+        user_key, where={'name__ne': grouping.name})) == []
 
 
 def test_iter_user_registrations_by_grouping(
@@ -524,13 +633,15 @@ def test_iter_user_registrations_by_grouping(
     Additionally tests the deletion of all registrations."""
     grouping = connection.set_grouping(grouping)
     assert grouping.key is not None
-    for i in range(7):
-        user = connection.set_user(User(None, "user-%d" % i))
-        assert user.key is not None
+    users = connection.set_users(User(None, "user-%d" % i) for i in range(7))
+    for i, user in enumerate(users):
         connection.set_registration(Registration(
-            grouping.key, user.key, UserPreferences()))
-        assert len(utils.LazyList(connection.iter_user_registrations_by_grouping(
-            grouping.key))) == i + 1
+            grouping.key, cast(UserKey, user.key), UserPreferences()))
+        assert connection.count_registrations_by_grouping(grouping.key) == i + 1
+    registered_users = [
+        user_registration.user for user_registration
+        in connection.iter_user_registrations_by_grouping(grouping.key)]
+    assert by_key(registered_users) == by_key(users)
     assert not utils.LazyList(connection.iter_user_registrations_by_grouping(
         GroupingKey(int=111)))
 
@@ -542,14 +653,15 @@ def test_iter_user_registrations_by_grouping(
 def insert_groups(
         connection: Connection, grouping: Grouping) -> Tuple[List[User], Groups]:
     """Create a tuple of result groups for a grouping."""
-    users = [connection.set_user(User(None, "user=%03d" % i)) for i in range(20)]
-    user_list = list(users)
+    users = connection.set_users(User(None, "user=%03d" % i) for i in range(20))
+    rnd = random.Random(0)
     group_list = []
-    while user_list:
-        group_size = random.randint(3, 7)
-        group = frozenset(cast(UserKey, user.key) for user in user_list[-group_size:])
-        group_list.append(group)
-        user_list = user_list[:-group_size]
+    start = 0
+    while start < len(users):
+        end = start + rnd.randint(3, 7)
+        group_list.append(
+            frozenset(cast(UserKey, user.key) for user in users[start:end]))
+        start = end
     groups = tuple(group_list)
 
     assert grouping.key is not None
@@ -572,12 +684,17 @@ def test_set_get_groups(connection: Connection, grouping: Grouping) -> None:
     assert connection.get_groups(grouping.key) == smaller_groups
     connection.set_groups(grouping.key, groups)
     assert connection.get_groups(grouping.key) == groups
+    connection.set_groups(grouping.key, ())
+    assert connection.get_groups(grouping.key) == ()
+    connection.delete_grouping(grouping.key)
+    assert not list(connection.iter_groups_by_user(next(iter(groups[0]))))
 
 
 def test_iter_groups_by_user(connection: Connection, grouping: Grouping) -> None:
     """Is a user belongs to some groups, return that groups."""
     grouping = connection.set_grouping(grouping)
     users, groups = insert_groups(connection, grouping)
+    group_set = set(groups)
     for user in users:
         assert user.key is not None
         named_user_groups = list(connection.iter_groups_by_user(user.key))
@@ -585,4 +702,7 @@ def test_iter_groups_by_user(connection: Connection, grouping: Grouping) -> None
         for named_user_group in named_user_groups:
             assert named_user_group.grouping_key == grouping.key
             assert named_user_group.grouping_name == grouping.name
-            assert frozenset(user.user_key for user in named_user_group.group) in groups
+            member_keys = frozenset(
+                member.user_key for member in named_user_group.group)
+            assert member_keys in group_set
+            assert user.key in member_keys
@@ -20,20 +20,23 @@
 """Test the specifics of SQLite-based repositories."""
 
 import dataclasses
-import os
-import os.path
 import sqlite3
-import tempfile
 from datetime import timedelta
-from typing import cast
+from typing import Optional, cast
 
 import pytest
 
 from ...core.models import (Grouping, Permissions, Registration, User, UserKey,
                             UserPreferences)
 from ...core.utils import now
+from ..base import DuplicateKey
 from ..sqlite import SqliteConnection, SqliteRepository
 
+_YET = now()
+_BASE_GROUPING = Grouping(
+    None, "", "grp", UserKey(int=0), _YET - timedelta(days=1),
+    _YET + timedelta(days=1), None, "RD", 5, 3, "nOt")
+
 
 def test_scheme() -> None:
     """Only sqlite: is a valid URL scheme."""
@@ -48,25 +51,16 @@ def test_url() -> None:
     assert SqliteRepository("sqlite:///").url == "sqlite:/"
 
 
-def test_connect() -> None:
+def test_connect(tmp_path) -> None:
     """Connecting to an SQLite DB is possible, except for invalid file names."""
     assert SqliteRepository("sqlite:").can_connect() is True
     assert SqliteRepository("sqlite://./\0").can_connect() is False
 
-    with tempfile.NamedTemporaryFile(suffix=".sqlite3", delete=False) as temp_file:
-        temp_file_name = temp_file.name
-        try:
-            assert SqliteRepository("sqlite://" + temp_file_name).can_connect()
-            temp_file.write(b"Hello World!\n")
-            # assert not SqliteRepository("sqlite://" + temp_file.name).can_connect()
-        finally:
-            os.unlink(temp_file_name)
-    assert not os.path.exists(temp_file_name)
-    try:
-        assert SqliteRepository("sqlite://" + temp_file_name).can_connect()
-    finally:
-        os.unlink(temp_file_name)
-    assert not os.path.exists(temp_file_name)
+    temp_path = tmp_path / "grpy.sqlite3"
+    repository = SqliteRepository("sqlite://" + str(temp_path))
+    assert repository.can_connect()
+    assert temp_path.exists()
+    assert repository.can_connect()
 
 
 def test_memory_always_other_connection() -> None:
@@ -81,24 +75,31 @@ def test_memory_always_other_connection() -> None:
     connection_2.close(True)
 
 
-def test_real_always_other_connection() -> None:
+def test_real_always_other_connection(tmp_path) -> None:
     """The repository will always return another connection for real SQLite."""
-    temp_file = tempfile.NamedTemporaryFile(  # pylint: disable=consider-using-with
-        suffix=".sqlite3", delete=False)
-    temp_file_name = temp_file.name
-    try:
-        temp_file.close()
-        repository = SqliteRepository("sqlite://" + temp_file_name)
-        connection_1 = repository.create()
-        assert connection_1 is not None
-        connection_2 = repository.create()
-        assert connection_2 is not None
-        assert connection_1 != connection_2
-        connection_1.close(True)
-        connection_2.close(False)
-    finally:
-        os.unlink(temp_file_name)
-    assert not os.path.exists(temp_file_name)
+    repository = SqliteRepository("sqlite://" + str(tmp_path / "grpy.sqlite3"))
+    connection_1 = repository.create()
+    assert connection_1 is not None
+    connection_2 = repository.create()
+    assert connection_2 is not None
+    assert connection_1 != connection_2
+    connection_1.close(True)
+    connection_2.close(False)
+
+
+def test_real_commit_rollback(tmp_path) -> None:
+    """Changes to a real SQLite are stored only if the connection succeeded."""
+    repository = SqliteRepository("sqlite://" + str(tmp_path / "grpy.sqlite3"))
+    assert repository.initialize()
+    connection = repository.create()
+    connection.set_users([User(None, "user-1"), User(None, "user-2")])
+    connection.close(True)
+    connection = repository.create()
+    connection.set_user(User(None, "user-3"))
+    connection.close(False)
+    connection = repository.create()
+    assert {user.ident for user in connection.iter_users()} == {"user-1", "user-2"}
+    connection.close(True)
 
 
 def test_memory_initialize() -> None:
@@ -114,13 +115,31 @@ def test_memory_initialize() -> None:
     assert user == user_2
 
 
-def test_memory_no_initialize(monkeypatch) -> None:
-    """Test for error in initializing memory-based repositories."""
-    def return_false(_):
-        return False
-    monkeypatch.setattr(SqliteRepository, "_connect", return_false)
+def test_memory_batch_transaction() -> None:
+    """A batch of an in-memory SQLite is committed, even if it fails."""
     repository = SqliteRepository("sqlite:")
-    assert repository.initialize() is False
+    assert repository.initialize()
+    connection = repository.create()
+    with pytest.raises(DuplicateKey, match="User.ident") as exc_info:
+        connection.set_users([User(None, "user-1"), User(None, "user-1")])
+    assert exc_info.value.args[1] == "user-1"
+    database = repository._connect()  # pylint: disable=protected-access
+    assert database is not None
+    assert not database.in_transaction
+    assert [user.ident for user in connection.iter_users()] == ["user-1"]
+
+
+class NoConnectRepository(SqliteRepository):
+    """A SQLite-based repository that is never able to connect."""
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Fail to connect to the database."""
+        return None
+
+
+def test_memory_no_initialize() -> None:
+    """Test for error in initializing memory-based repositories."""
+    assert NoConnectRepository("sqlite:").initialize() is False
 
 
 def test_failed_connection() -> None:
@@ -131,10 +150,22 @@ def test_failed_connection() -> None:
         conn.close(True)
 
 
-def get_connection() -> SqliteConnection:
-    """Create an initialized repository."""
+def _create_template() -> sqlite3.Connection:
+    """Create an in-memory database that contains the initialized schema."""
     repository = SqliteRepository("sqlite:")
     repository.initialize()
+    connection = repository._connect()  # pylint: disable=protected-access
+    return cast(sqlite3.Connection, connection)
+
+
+_TEMPLATE = _create_template()
+
+
+def get_connection() -> SqliteConnection:
+    """Create an initialized repository by copying the schema template."""
+    repository = SqliteRepository("sqlite:")
+    connection = repository._connect()  # pylint: disable=protected-access
+    _TEMPLATE.backup(cast(sqlite3.Connection, connection))
     return cast(SqliteConnection, repository.create())
 
 
@@ -149,8 +180,8 @@ class MockCursor:
         """Close the mock cursor."""
 
 
-def raise_exception(_self, sql: str, _values):
-    """Mock method that substitutes SqliteConnection._execute."""
+def raise_exception(sql: str, _values=()):
+    """Mock function that substitutes _execute of a SqliteConnection."""
     if sql.startswith("SELECT "):
         return MockCursor()
     raise sqlite3.IntegrityError("Unknown")
@@ -159,22 +190,18 @@ def raise_exception(_self, sql: str, _values):
 def test_insert_user(monkeypatch) -> None:
     """Check that inserting a user can raise an exception."""
     connection = get_connection()
-    user_1 = connection.set_user(User(None, "user_1"))
-    user_2 = connection.set_user(User(None, "user_2"))
+    users = connection.set_users([User(None, "user_1"), User(None, "user_2")])
 
-    monkeypatch.setattr(SqliteConnection, "_execute", raise_exception)
+    monkeypatch.setattr(connection, "_execute", raise_exception)
     with pytest.raises(sqlite3.IntegrityError):
         connection.set_user(User(None, "admin"))
     with pytest.raises(sqlite3.IntegrityError):
-        connection.set_user(dataclasses.replace(user_2, ident=user_1.ident))
+        connection.set_user(dataclasses.replace(users[1], ident=users[0].ident))
 
 
 def make_grouping(code: str, host_key: UserKey) -> Grouping:
     """Create a grouping with a specific code for a specific host user."""
-    yet = now()
-    return Grouping(
-        None, code, "grp", host_key, yet - timedelta(days=1),
-        yet + timedelta(days=1), None, "RD", 5, 3, "nOt")
+    return dataclasses.replace(_BASE_GROUPING, code=code, host_key=host_key)
 
 
 def test_set_grouping_exception(monkeypatch) -> None:
@@ -182,14 +209,15 @@ def test_set_grouping_exception(monkeypatch) -> None:
     connection = get_connection()
     host = connection.set_user(User(None, "host", Permissions.HOST))
     assert host.key is not None
-    grouping_1 = connection.set_grouping(make_grouping("code", host.key))
-    grouping_2 = connection.set_grouping(make_grouping("abcd", host.key))
+    groupings = connection.set_groupings(
+        [make_grouping("code", host.key), make_grouping("abcd", host.key)])
 
-    monkeypatch.setattr(SqliteConnection, "_execute", raise_exception)
+    monkeypatch.setattr(connection, "_execute", raise_exception)
     with pytest.raises(sqlite3.IntegrityError):
         connection.set_grouping(make_grouping("xyz", host.key))
     with pytest.raises(sqlite3.IntegrityError):
-        connection.set_grouping(dataclasses.replace(grouping_2, code=grouping_1.code))
+        connection.set_grouping(
+            dataclasses.replace(groupings[1], code=groupings[0].code))
 
 
 class NotRegistered(UserPreferences):  # pylint: disable=too-few-public-methods
@@ -241,8 +269,7 @@ def test_iter_user_registrations_by_grouping() -> None:
     grouping = connection.set_grouping(make_grouping("code", host.key))
     assert grouping.key is not None
 
-    for i in range(8):
-        user = connection.set_user(User(None, "user-%d" % i))
+    for user in connection.set_users(User(None, "user-%d" % i) for i in range(8)):
         assert user.key is not None
         connection.set_registration(Registration(
             grouping.key, user.key, UserPreferences()))
@@ -250,4 +277,5 @@ def test_iter_user_registrations_by_grouping() -> None:
     assert len(list(connection.iter_user_registrations_by_grouping(grouping.key))) == 8
     connection._execute(  # pylint: disable=protected-access
         "UPDATE registrations SET preferences=''")
+    assert connection.count_registrations_by_grouping(grouping.key) == 8
     assert not connection.iter_user_registrations_by_grouping(grouping.key)
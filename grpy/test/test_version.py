@@ -25,7 +25,8 @@ from unittest.mock import Mock
 
 import pkg_resources
 
-from ..version import Version, get_version, read_version_file
+from ..version import (Version, _get_user_version, get_version,
+                       read_version_file)
 
 
 def test_read_version_file() -> None:
@@ -71,4 +72,8 @@ def test_get_version_from_distribution(monkeypatch) -> None:
         return mock
 
     monkeypatch.setattr(pkg_resources, 'get_distribution', get_distribution)
-    assert get_version([]) == Version("321", "", "")
+    _get_user_version.cache_clear()
+    try:
+        assert get_version([]) == Version("321", "", "")
+    finally:
+        _get_user_version.cache_clear()
@@ -20,8 +20,10 @@
 """Provide version information."""
 
 import dataclasses
+import functools
+import itertools
 import pathlib
-from typing import Optional, Sequence
+from typing import Optional, Sequence, cast
 
 import pkg_resources
 
@@ -39,17 +41,12 @@ def get_version_file(path: Optional[str], max_level: int) -> Sequence[str]:
     """Read the file VERSION.txt and return its content as a sequence."""
     if path:
         current_path = pathlib.Path(path)
-        current_level = max_level
-        while current_level > 0:
-            version_path = current_path / "VERSION.txt"
-            try:
+        for directory in itertools.islice(
+                itertools.chain([current_path], current_path.parents), max_level):
+            version_path = directory / "VERSION.txt"
+            if version_path.is_file():
                 with version_path.open() as version_file:
-                    return [line.strip() for line in version_file.readlines()]
-            except FileNotFoundError:
-                pass
-
-            current_level -= 1
-            current_path = current_path.parent
+                    return [line.strip() for line in version_file]
     return []
 
 
@@ -61,19 +58,16 @@ def read_version_file(path: Optional[str], max_level: int) -> Sequence[str]:
     return lines
 
 
-def get_version(lines: Sequence[str]) -> Version:
-    """Return version information."""
+@functools.lru_cache(maxsize=None)
+def _get_user_version() -> str:
+    """Return the version of the installed distribution, or an empty string."""
     try:
-        user_version = pkg_resources.get_distribution("grpy").version
+        return cast(str, pkg_resources.get_distribution("grpy").version)
     except pkg_resources.DistributionNotFound:
-        user_version = ""
-    if not lines:
-        vcs_version = ""
-        build_date = ""
-    elif len(lines) < 2:
-        vcs_version = lines[0]
-        build_date = ""
-    else:
-        vcs_version = lines[0]
-        build_date = lines[1]
-    return Version(user_version, vcs_version, build_date)
+        return ""
+
+
+def get_version(lines: Sequence[str]) -> Version:
+    """Return version information."""
+    vcs_version, build_date = (*lines[:2], "", "")[:2]
+    return Version(_get_user_version(), vcs_version, build_date)
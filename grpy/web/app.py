@@ -21,6 +21,7 @@
 
 import functools
 import os
+from datetime import timedelta
 from typing import Any, Dict, Optional, cast
 
 import pytz
@@ -29,7 +30,8 @@ import pytz.tzinfo  # type: ignore
 from flask import Flask, g, make_response, render_template, session
 from flask_babel import Babel  # type: ignore
 
-from ..core.models import Permissions, User, UserKey
+from ..core.models import Grouping, Permissions, User, UserKey
+from ..core.utils import now
 from ..repo import create_repository
 from ..repo.base import Connection, Repository
 from ..repo.logic import set_grouping_new_code
@@ -142,12 +144,13 @@ class GrpyApp(Flask):
 
     def get_connection(self) -> Connection:
         """Return an open connection, specific for this request."""
-        if 'connection' not in g:
+        connection = g.get('connection', None)
+        if connection is None:
             if self._repository is None:
                 raise TypeError("Repository not set")
-            g.connection = \
+            connection = g.connection = \
                 self._repository.create()  # pylint: disable=assigning-non-slot
-        return cast(Connection, g.connection)
+        return cast(Connection, connection)
 
     @staticmethod
     def _clear_session() -> None:
@@ -275,26 +278,19 @@ def populate_testdata(repository: Repository) -> None:
         connection.set_user(User(None, "student"))
         connection.set_user(User(None, "xnologin"))
 
-        from datetime import (  # pylint: disable=import-outside-toplevel
-            timedelta)
-        from ..core.models import (  # pylint: disable=import-outside-toplevel
-            Grouping)
-        from ..core.utils import (  # pylint: disable=import-outside-toplevel
-            now as utils_now)
-
-        now = utils_now()
+        yet = now()
         for user_obj in (kreuz, stern):
             set_grouping_new_code(connection, Grouping(
                 None, ".", "PM", cast(UserKey, user_obj.key),
-                now, now + timedelta(days=14), None,
+                yet, yet + timedelta(days=14), None,
                 "RD", 7, 7, "Note: not"))
             set_grouping_new_code(connection, Grouping(
                 None, ".", "SWE", cast(UserKey, user_obj.key),
-                now, now + timedelta(days=7), now + timedelta(days=14),
+                yet, yet + timedelta(days=7), yet + timedelta(days=14),
                 "RD", 7, 7, "Was?"))
         set_grouping_new_code(connection, Grouping(
             None, ".", "PSITS", cast(UserKey, kreuz.key),
-            now + timedelta(days=1), now + timedelta(days=8), None,
+            yet + timedelta(days=1), yet + timedelta(days=8), None,
             "RD", 5, 3, "Nun wird es spannend"))
     finally:
         connection.close(True)
@@ -19,6 +19,8 @@
 
 """Tests for the grouping policies."""
 
+import pytest
+
 from ....core.models import GroupingKey, Registration, UserKey, UserPreferences
 from ....policies import get_policy
 from .. import (EmptyPolicyForm, get_policy_name, get_policy_names,
@@ -39,11 +41,10 @@ def test_policies_implemented() -> None:
             assert get_policy(code) != id_policy
 
 
-def test_get_policy_name() -> None:
+@pytest.mark.parametrize("code,name", get_policy_names() + [("", "")])
+def test_get_policy_name(code: str, name: str) -> None:
     """Always get the right name for a policy code."""
-    for code, name in get_policy_names():
-        assert name == get_policy_name(code)
-    assert get_policy_name("") == ""
+    assert name == get_policy_name(code)
 
 
 def test_get_registration_form(ram_app) -> None:  # pylint: disable=unused-argument